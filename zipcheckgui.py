@@ -1,15 +1,194 @@
 import sys
 import os
+import shutil
 import subprocess
 from pathlib import Path
 from typing import Optional
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QPushButton, QFrame, QTextEdit,
+    QLabel, QPushButton, QFrame, QPlainTextEdit,
     QFileDialog, QGraphicsDropShadowEffect, QScrollArea
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
-from PyQt6.QtGui import QFont, QColor, QPalette, QTextCursor, QPainter, QLinearGradient
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
+from PyQt6.QtGui import QFont, QColor, QPalette, QPainter, QLinearGradient, QPixmap
+
+
+# Drop shadows on static widgets are rendered through an offscreen pixmap
+ENABLE_SHADOWS = False
+
+
+# Shared fonts - QFont is implicitly shared, so one instance per style
+# is reused by every widget
+FONT_ICON = QFont("Segoe UI Emoji", 56)
+FONT_HEADER = QFont("Segoe UI", 36, QFont.Weight.Bold)
+FONT_SUBTITLE = QFont("Segoe UI", 16)
+FONT_TITLE = QFont("Segoe UI", 16, QFont.Weight.Bold)
+FONT_BUTTON_LARGE = QFont("Segoe UI", 13, QFont.Weight.Bold)
+FONT_SECTION = QFont("Segoe UI", 12, QFont.Weight.Bold)
+FONT_BODY = QFont("Segoe UI", 11)
+FONT_BUTTON = QFont("Segoe UI", 10, QFont.Weight.Bold)
+FONT_MONO = QFont("Consolas", 10)
+
+
+# Shared colors - built once from integer components
+COLOR_BG_START = QColor(0x1a, 0x1a, 0x1a)  # Dark grey
+COLOR_BG_MID = QColor(0x0d, 0x0d, 0x0d)  # Darker grey
+COLOR_BG_END = QColor(0, 0, 0)  # Black
+COLOR_WINDOW = QColor(10, 10, 10)
+COLOR_TEXT = QColor(255, 255, 255)
+SHADOW_SUBTLE = QColor(0, 0, 0, 30)
+SHADOW_GLOW = QColor(255, 255, 255, 40)
+
+
+# Application-wide stylesheet, parsed once in main(). Widgets are matched
+# by class or objectName. GlassFrame hover is handled by Qt's style engine
+# through the :hover pseudo-state, the drag highlight through the
+# dragActive dynamic property.
+APP_QSS = """
+    GlassFrame {
+        background-color: rgba(255, 255, 255, 0.03);
+        border: 1px solid rgba(255, 255, 255, 0.08);
+        border-radius: 16px;
+    }
+    GlassFrame[hoverable="true"]:hover,
+    GlassFrame[dragActive="true"] {
+        background-color: rgba(255, 255, 255, 0.08);
+        border: 1px solid rgba(255, 255, 255, 0.18);
+    }
+    
+    QLabel#iconLabel {
+        color: rgba(255, 255, 255, 0.7);
+    }
+    QLabel#dropTitle, QLabel#consoleTitle {
+        color: rgba(255, 255, 255, 0.95);
+    }
+    QLabel#infoLabel {
+        color: rgba(180, 160, 170, 0.7);
+        font-size: 11pt;
+    }
+    QLabel#fileLabel {
+        color: rgba(255, 255, 255, 0.9);
+        font-weight: 600;
+        font-size: 10pt;
+    }
+    
+    QPushButton#browseBtn {
+        background-color: rgba(255, 255, 255, 0.05);
+        color: white;
+        border: 1px solid rgba(255, 255, 255, 0.12);
+        padding: 10px 28px;
+        border-radius: 8px;
+        font-weight: 600;
+    }
+    QPushButton#browseBtn:hover {
+        background-color: rgba(255, 255, 255, 0.1);
+        border: 1px solid rgba(255, 255, 255, 0.2);
+    }
+    QPushButton#browseBtn:pressed {
+        background-color: rgba(255, 255, 255, 0.08);
+    }
+    
+    QLabel#header {
+        color: white;
+        letter-spacing: 1px;
+    }
+    QLabel#subtitle {
+        color: rgba(180, 160, 170, 0.8);
+    }
+    
+    QPushButton#validateBtn {
+        background-color: rgba(255, 255, 255, 0.08);
+        color: white;
+        border: 1px solid rgba(255, 255, 255, 0.15);
+        padding: 16px 32px;
+        border-radius: 12px;
+        font-weight: 700;
+        letter-spacing: 0.5px;
+    }
+    QPushButton#validateBtn:hover {
+        background-color: rgba(255, 255, 255, 0.12);
+        border: 1px solid rgba(255, 255, 255, 0.25);
+    }
+    QPushButton#validateBtn:pressed {
+        background-color: rgba(255, 255, 255, 0.1);
+    }
+    QPushButton#validateBtn:disabled {
+        background-color: rgba(255, 255, 255, 0.02);
+        color: rgba(180, 160, 170, 0.5);
+        border: 1px solid rgba(255, 255, 255, 0.05);
+    }
+    
+    QLabel#statusLabel {
+        color: rgba(180, 160, 170, 0.7);
+    }
+    
+    QPlainTextEdit#console {
+        background-color: rgba(0, 0, 0, 0.3);
+        color: rgba(230, 220, 225, 0.95);
+        border: 1px solid rgba(255, 255, 255, 0.08);
+        border-radius: 8px;
+        padding: 16px;
+        line-height: 1.4;
+    }
+    
+    QScrollArea#scrollArea {
+        border: none;
+        background: transparent;
+    }
+    /* Shared by the window scroll area and the console */
+    QScrollBar:vertical {
+        background: rgba(0, 0, 0, 0.2);
+        width: 12px;
+        border-radius: 6px;
+        margin: 0px;
+    }
+    QScrollBar::handle:vertical {
+        background: rgba(255, 255, 255, 0.2);
+        border-radius: 6px;
+        min-height: 30px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background: rgba(255, 255, 255, 0.3);
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+    QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+        background: none;
+    }
+    
+    QLabel#versionLabel {
+        color: rgba(150, 140, 150, 0.5);
+        font-size: 9pt;
+    }
+    QLabel#authorLabel {
+        color: rgba(150, 140, 150, 0.45);
+        font-size: 8.5pt;
+    }
+"""
+
+
+# PyInstaller extraction directory, when running from a bundle
+_MEIPASS = getattr(sys, '_MEIPASS', None)
+
+
+def resource_path(name: str) -> Optional[Path]:
+    """Return the first existing bundled, script-relative or cwd path for name"""
+    candidates = [
+        Path(_MEIPASS) / name if _MEIPASS else None,
+        Path(__file__).parent / name,
+        Path.cwd() / name,
+    ]
+    for p in candidates:
+        if p is not None and p.exists():
+            return p.absolute()
+    return None
+
+
+# Resolved once at import - default the script to the current directory so
+# a missing validator is reported by ValidatorThread
+_VALIDATOR_SCRIPT = resource_path('inputzipcheck.js') or Path.cwd() / 'inputzipcheck.js'
+_ICON_PATH = resource_path('ZipCheck-ico.ico')
 
 
 class GradientWidget(QWidget):
@@ -17,79 +196,88 @@ class GradientWidget(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
-        
-    def paintEvent(self, event):
-        """Paint gradient background - dark grey to black"""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        
-        # Dark grey to black gradient
+        # The cached gradient covers every pixel, so Qt can skip clearing
+        # the background before each paint
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        self._bg_pixmap: Optional[QPixmap] = None
+        
+    def resizeEvent(self, event):
+        """Rasterize the gradient once per size change"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        
+        # Dark grey to darker grey to black gradient
         gradient = QLinearGradient(0, 0, self.width(), self.height())
-        gradient.setColorAt(0.0, QColor("#1a1a1a"))  # Dark grey
-        gradient.setColorAt(0.5, QColor("#0d0d0d"))  # Darker grey
-        gradient.setColorAt(1.0, QColor("#000000"))  # Black
+        gradient.setColorAt(0.0, COLOR_BG_START)
+        gradient.setColorAt(0.5, COLOR_BG_MID)
+        gradient.setColorAt(1.0, COLOR_BG_END)
         
+        painter = QPainter(pixmap)
         painter.fillRect(self.rect(), gradient)
+        painter.end()
+        
+        self._bg_pixmap = pixmap
+        super().resizeEvent(event)
+        
+    def paintEvent(self, event):
+        """Paint gradient background - blit the cached pixmap"""
+        painter = QPainter(self)
+        if self._bg_pixmap is None:
+            # Opaque paint - nothing is drawn underneath, so fill until the
+            # first resize has built the gradient
+            painter.fillRect(event.rect(), self.palette().window())
+            return
+        painter.drawPixmap(0, 0, self._bg_pixmap)
 
 
 class GlassFrame(QFrame):
     """True glassmorphism frame - transparent with visible background"""
     
-    def __init__(self, parent=None, hoverable=False):
+    def __init__(self, parent=None, hoverable=False, with_shadow=False):
         super().__init__(parent)
         self.hoverable = hoverable
-        self.is_hovering = False
-        self.setup_glass_effect()
-        
-    def setup_glass_effect(self):
-        """Setup true glassmorphism - transparent panels"""
-        if self.is_hovering and self.hoverable:
-            # Hover state - subtle light glow
-            self.setStyleSheet("""
-                GlassFrame {
-                    background-color: rgba(255, 255, 255, 0.08);
-                    border: 1px solid rgba(255, 255, 255, 0.18);
-                    border-radius: 16px;
-                }
-            """)
-            
-            # Subtle white glow on hover
-            shadow = QGraphicsDropShadowEffect(self)
-            shadow.setBlurRadius(30)
-            shadow.setColor(QColor(255, 255, 255, 40))
-            shadow.setOffset(0, 0)
-            self.setGraphicsEffect(shadow)
+        self.setProperty("hoverable", hoverable)
+        self.setProperty("dragActive", False)
+        
+        # WA_NoSystemBackground / WA_TranslucentBackground are deliberately
+        # not set: on a child widget they also skip the styled background
+        # pass, which is what draws the translucent panel.
+        
+        # Optional, very subtle shadow. It is off by default since a
+        # graphics effect renders the whole frame offscreen on every paint;
+        # the border already outlines the panel. The hover glow used to swap
+        # the shadow from Python enter/leave handlers; that was removed
+        # intentionally since stylesheets cannot drive a QGraphicsEffect.
+        # The effect is installed once and only its properties change
+        # afterwards - setGraphicsEffect is never called again.
+        self._shadow: Optional[QGraphicsDropShadowEffect] = None
+        if with_shadow:
+            self._shadow = QGraphicsDropShadowEffect(self)
+            self.setGraphicsEffect(self._shadow)
+            self._update_shadow(False)
+        
+    def set_drag_active(self, active: bool) -> None:
+        """Toggle the highlighted state used while a file is dragged over"""
+        if self.property("dragActive") == active:
+            return
+        self.setProperty("dragActive", active)
+        # Dynamic property selectors are only re-evaluated on repolish
+        self.style().unpolish(self)
+        self.style().polish(self)
+        if self._shadow is not None:
+            self._update_shadow(active)
+        
+    def _update_shadow(self, glow: bool) -> None:
+        """Switch the installed shadow between subtle and glowing"""
+        if glow:
+            self._shadow.setBlurRadius(30)
+            self._shadow.setColor(SHADOW_GLOW)
+            self._shadow.setOffset(0, 0)
         else:
-            # Normal state - transparent glass
-            self.setStyleSheet("""
-                GlassFrame {
-                    background-color: rgba(255, 255, 255, 0.03);
-                    border: 1px solid rgba(255, 255, 255, 0.08);
-                    border-radius: 16px;
-                }
-            """)
-            
-            # Very subtle shadow
-            shadow = QGraphicsDropShadowEffect(self)
-            shadow.setBlurRadius(20)
-            shadow.setColor(QColor(0, 0, 0, 30))
-            shadow.setOffset(0, 4)
-            self.setGraphicsEffect(shadow)
-    
-    def enterEvent(self, event):
-        """Handle mouse enter"""
-        if self.hoverable:
-            self.is_hovering = True
-            self.setup_glass_effect()
-        super().enterEvent(event)
-    
-    def leaveEvent(self, event):
-        """Handle mouse leave"""
-        if self.hoverable:
-            self.is_hovering = False
-            self.setup_glass_effect()
-        super().leaveEvent(event)
+            self._shadow.setBlurRadius(20)
+            self._shadow.setColor(SHADOW_SUBTLE)
+            self._shadow.setOffset(0, 4)
 
 
 class DropZone(GlassFrame):
@@ -115,58 +303,36 @@ class DropZone(GlassFrame):
         
         # Icon
         self.icon_label = QLabel(self.icon)
-        self.icon_label.setFont(QFont("Segoe UI Emoji", 56))
+        self.icon_label.setFont(FONT_ICON)
         self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.icon_label.setStyleSheet("color: rgba(255, 255, 255, 0.7);")
+        self.icon_label.setObjectName("iconLabel")
         layout.addWidget(self.icon_label)
         
         # Title
         title_label = QLabel(self.title)
-        title_label.setFont(QFont("Segoe UI", 16, QFont.Weight.Bold))
+        title_label.setFont(FONT_TITLE)
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet("color: rgba(255, 255, 255, 0.95);")
+        title_label.setObjectName("dropTitle")
         layout.addWidget(title_label)
         
         # Instructions
         self.info_label = QLabel("Drag & Drop or Click to Browse")
         self.info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.info_label.setStyleSheet("color: rgba(180, 160, 170, 0.7); font-size: 11pt;")
+        self.info_label.setObjectName("infoLabel")
         layout.addWidget(self.info_label)
         
         # File name display
         self.file_label = QLabel("")
         self.file_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.file_label.setStyleSheet("""
-            QLabel {
-                color: rgba(255, 255, 255, 0.9);
-                font-weight: 600;
-                font-size: 10pt;
-            }
-        """)
+        self.file_label.setObjectName("fileLabel")
         self.file_label.setWordWrap(True)
         layout.addWidget(self.file_label)
         
         # Browse button
         self.browse_btn = QPushButton("Browse Files")
-        self.browse_btn.setFont(QFont("Segoe UI", 10, QFont.Weight.Bold))
+        self.browse_btn.setFont(FONT_BUTTON)
         self.browse_btn.setMinimumHeight(40)
-        self.browse_btn.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(255, 255, 255, 0.05);
-                color: white;
-                border: 1px solid rgba(255, 255, 255, 0.12);
-                padding: 10px 28px;
-                border-radius: 8px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 255, 255, 0.1);
-                border: 1px solid rgba(255, 255, 255, 0.2);
-            }
-            QPushButton:pressed {
-                background-color: rgba(255, 255, 255, 0.08);
-            }
-        """)
+        self.browse_btn.setObjectName("browseBtn")
         self.browse_btn.clicked.connect(self.browse_file)
         layout.addWidget(self.browse_btn, alignment=Qt.AlignmentFlag.AlignCenter)
         
@@ -196,23 +362,21 @@ class DropZone(GlassFrame):
         if event.mimeData().hasUrls():
             urls = event.mimeData().urls()
             if urls:
-                path = Path(urls[0].toLocalFile())
-                if path.is_file() and path.suffix == '.zip':
+                # Cheap name check only - the file itself is checked on drop
+                url = urls[0].toLocalFile()
+                if url.lower().endswith('.zip'):
                     event.acceptProposedAction()
-                    self.is_hovering = True
-                    self.setup_glass_effect()
+                    self.set_drag_active(True)
     
     def dragLeaveEvent(self, event) -> None:
         """Handle drag leave event"""
-        self.is_hovering = False
-        self.setup_glass_effect()
+        self.set_drag_active(False)
     
     def dropEvent(self, event) -> None:
         """Handle drop event"""
         files = [u.toLocalFile() for u in event.mimeData().urls()]
         if files:
-            path = Path(files[0])
-            if path.is_file() and path.suffix == '.zip':
+            if files[0].lower().endswith('.zip') and Path(files[0]).is_file():
                 self.set_file(files[0])
         self.dragLeaveEvent(event)
 
@@ -222,10 +386,16 @@ class ValidatorThread(QThread):
     log_update = pyqtSignal(str)
     finished_signal = pyqtSignal(bool, str)
     
+    # Resolved node executable, set once found - later runs skip the lookup
+    _node_exe: Optional[str] = None
+    
     def __init__(self, zip_path: str, validator_script: str):
         super().__init__()
         self.zip_path = zip_path
         self.validator_script = validator_script
+        # Resolved once - used for the existence check and as the cwd
+        self.script_path = Path(validator_script).absolute()
+        self.script_dir = self.script_path.parent
         
     def run(self) -> None:
         try:
@@ -239,23 +409,18 @@ class ValidatorThread(QThread):
                 startupinfo = None
                 creationflags = 0
             
-            # Check if Node.js is available
-            try:
-                subprocess.run(
-                    ['node', '--version'], 
-                    capture_output=True, 
-                    check=True,
-                    startupinfo=startupinfo,
-                    creationflags=creationflags
-                )
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                self.log_update.emit("❌ ERROR: Node.js not found!")
-                self.log_update.emit("Please install Node.js from https://nodejs.org/")
-                self.finished_signal.emit(False, "Node.js not installed")
-                return
+            # Check if Node.js is available - a PATH lookup, no process spawn
+            if ValidatorThread._node_exe is None:
+                node_exe = shutil.which('node')
+                if node_exe is None:
+                    self.log_update.emit("❌ ERROR: Node.js not found!")
+                    self.log_update.emit("Please install Node.js from https://nodejs.org/")
+                    self.finished_signal.emit(False, "Node.js not installed")
+                    return
+                ValidatorThread._node_exe = node_exe
             
             # Check if validator script exists
-            if not Path(self.validator_script).exists():
+            if not self.script_path.exists():
                 self.log_update.emit(f"❌ ERROR: Validator script not found: {self.validator_script}")
                 self.finished_signal.emit(False, "Validator script missing")
                 return
@@ -263,45 +428,39 @@ class ValidatorThread(QThread):
             self.log_update.emit(f"🔍 Validating: {Path(self.zip_path).name}")
             self.log_update.emit("")
             
-            # Run the validator
-            result = subprocess.run(
-                ['node', self.validator_script, self.zip_path],
-                capture_output=True,
-                text=True,
+            # Run the validator - stderr is merged into stdout so output is
+            # streamed in order, line by line, as the validator produces it
+            with subprocess.Popen(
+                [ValidatorThread._node_exe, str(self.script_path), str(self.zip_path)],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 encoding="utf-8",
                 errors="replace",
-                cwd=Path(self.validator_script).parent,
+                bufsize=1,
+                cwd=str(self.script_dir),
                 startupinfo=startupinfo,
                 creationflags=creationflags
-            )
-            
-            # Output stdout - emit in chunks of 50 lines at once
-            if result.stdout:
-                lines = result.stdout.strip().split('\n')
-                chunk_size = 50
-                for i in range(0, len(lines), chunk_size):
-                    chunk = '\n'.join(lines[i:i+chunk_size])
-                    self.log_update.emit(chunk)
-
-            # Output stderr - emit in chunks
-            if result.stderr:
-                self.log_update.emit("")
-                self.log_update.emit("⚠️ ERRORS/WARNINGS:")
-                error_lines = result.stderr.strip().split('\n')
-                chunk_size = 50
-                for i in range(0, len(error_lines), chunk_size):
-                    chunk = '\n'.join(error_lines[i:i+chunk_size])
-                    self.log_update.emit(chunk)
+            ) as proc:
+                try:
+                    # One signal per line - the window batches them into the console
+                    for line in proc.stdout:
+                        self.log_update.emit(line.rstrip())
+                    returncode = proc.wait()
+                finally:
+                    # Reading stopped early - don't leave node running; the
+                    # with block then closes the pipe and reaps the child
+                    if proc.poll() is None:
+                        proc.kill()
             
             # Check result
-            if result.returncode == 0:
+            if returncode == 0:
                 self.log_update.emit("")
                 self.log_update.emit("✅ VALIDATION COMPLETE")
                 self.finished_signal.emit(True, "Validation successful")
             else:
                 self.log_update.emit("")
-                self.log_update.emit(f"❌ VALIDATION FAILED (Exit code: {result.returncode})")
-                self.finished_signal.emit(False, f"Validation failed with exit code {result.returncode}")
+                self.log_update.emit(f"❌ VALIDATION FAILED (Exit code: {returncode})")
+                self.finished_signal.emit(False, f"Validation failed with exit code {returncode}")
                 
                 
         except Exception as e:
@@ -315,38 +474,25 @@ class ValidatorThread(QThread):
 class ResourcePackValidator(QMainWindow):
     """Main application window with glassmorphism"""
     
+    # Buffered log lines are written to the console at most this often (ms)
+    LOG_FLUSH_INTERVAL = 50
+    
     def __init__(self):
         super().__init__()
         self.input_file: Optional[str] = None
         self.validator_thread: Optional[ValidatorThread] = None
         
-        # Find validator script
-        self.validator_script = self.find_validator_script()
+        # Log lines are buffered and appended once per timer tick, so the
+        # console relayouts once per batch instead of once per line
+        self._log_buffer: list[str] = []
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(self.LOG_FLUSH_INTERVAL)
+        self._log_timer.timeout.connect(self.flush_log)
         
-        self.initUI()
-        
-    def find_validator_script(self) -> str:
-        """Find the inputzipcheck.js script"""
-        # Check common locations
-        possible_paths = [
-            Path("inputzipcheck.js"),
-            Path(__file__).parent / "inputzipcheck.js",
-            Path.cwd() / "inputzipcheck.js"
-        ]
+        self.validator_script = str(_VALIDATOR_SCRIPT)
         
-        # Try _MEIPASS for PyInstaller
-        try:
-            base_path = sys._MEIPASS
-            possible_paths.insert(0, Path(base_path) / "inputzipcheck.js")
-        except:
-            pass
-        
-        for p in possible_paths:
-            if p.exists():
-                return str(p.absolute())
-        
-        # Default to current directory
-        return str(Path("inputzipcheck.js").absolute())
+        self.initUI()
         
     def initUI(self) -> None:
         """Initialize the user interface"""
@@ -356,65 +502,27 @@ class ResourcePackValidator(QMainWindow):
         # Set window icon
         from PyQt6.QtGui import QIcon
         
-        # Find icon in bundled or dev location
-        possible_icon_paths = [
-            Path("ZipCheck-ico.ico"),
-            Path(__file__).parent / "ZipCheck-ico.ico",
-        ]
-        
-        # Try _MEIPASS for PyInstaller
-        try:
-            base_path = sys._MEIPASS
-            possible_icon_paths.insert(0, Path(base_path) / "ZipCheck-ico.ico")
-        except:
-            pass
-        
-        for icon_path in possible_icon_paths:
-            if icon_path.exists():
-                self.setWindowIcon(QIcon(str(icon_path)))
-                break
+        if _ICON_PATH is not None:
+            self.setWindowIcon(QIcon(str(_ICON_PATH)))
         
         try:
             import ctypes
             ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID('saymc.resourcepackvalidator.1.0.0')
-        except:
+        except (AttributeError, OSError):
+            # Not on Windows (no ctypes.windll) or the call is unavailable
             pass
 
         # Create gradient background widget
         gradient_bg = GradientWidget()
         
-        # Create scroll area
+        # Create scroll area - the full column is taller than the 700 px
+        # minimum window height, so it must stay scrollable
         scroll_area = QScrollArea()
+        scroll_area.setObjectName("scrollArea")
         scroll_area.setWidget(gradient_bg)
         scroll_area.setWidgetResizable(True)
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background: transparent;
-            }
-            QScrollBar:vertical {
-                background: rgba(0, 0, 0, 0.2);
-                width: 12px;
-                border-radius: 6px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: rgba(255, 255, 255, 0.2);
-                border-radius: 6px;
-                min-height: 30px;
-            }
-            QScrollBar::handle:vertical:hover {
-                background: rgba(255, 255, 255, 0.3);
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
-                background: none;
-            }
-        """)
         self.setCentralWidget(scroll_area)
         
         # Main layout
@@ -427,15 +535,15 @@ class ResourcePackValidator(QMainWindow):
         header_container.setSpacing(8)
         
         header = QLabel("Resource Pack Validator")
-        header.setFont(QFont("Segoe UI", 36, QFont.Weight.Bold))
+        header.setFont(FONT_HEADER)
         header.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        header.setStyleSheet("color: white; letter-spacing: 1px;")
+        header.setObjectName("header")
         header_container.addWidget(header)
         
         subtitle = QLabel("Minecraft Resource Pack Security Validation")
-        subtitle.setFont(QFont("Segoe UI", 16))
+        subtitle.setFont(FONT_SUBTITLE)
         subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        subtitle.setStyleSheet("color: rgba(180, 160, 170, 0.8);")
+        subtitle.setObjectName("subtitle")
         header_container.addWidget(subtitle)
         
         main_layout.addLayout(header_container)
@@ -449,36 +557,17 @@ class ResourcePackValidator(QMainWindow):
         # Validate button
         self.validate_btn = QPushButton("Validate Pack →")
         self.validate_btn.setMinimumHeight(56)
-        self.validate_btn.setFont(QFont("Segoe UI", 13, QFont.Weight.Bold))
-        self.validate_btn.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(255, 255, 255, 0.08);
-                color: white;
-                border: 1px solid rgba(255, 255, 255, 0.15);
-                padding: 16px 32px;
-                border-radius: 12px;
-                font-weight: 700;
-                letter-spacing: 0.5px;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 255, 255, 0.12);
-                border: 1px solid rgba(255, 255, 255, 0.25);
-            }
-            QPushButton:pressed {
-                background-color: rgba(255, 255, 255, 0.1);
-            }
-            QPushButton:disabled {
-                background-color: rgba(255, 255, 255, 0.02);
-                color: rgba(180, 160, 170, 0.5);
-                border: 1px solid rgba(255, 255, 255, 0.05);
-            }
-        """)
-        
-        btn_shadow = QGraphicsDropShadowEffect(self.validate_btn)
-        btn_shadow.setBlurRadius(20)
-        btn_shadow.setColor(QColor(255, 255, 255, 40))
-        btn_shadow.setOffset(0, 4)
-        self.validate_btn.setGraphicsEffect(btn_shadow)
+        self.validate_btn.setFont(FONT_BUTTON_LARGE)
+        self.validate_btn.setObjectName("validateBtn")
+        
+        # The button border already outlines it - the glow is opt-in since
+        # the effect paints the button offscreen for its whole lifetime
+        if ENABLE_SHADOWS:
+            btn_shadow = QGraphicsDropShadowEffect(self.validate_btn)
+            btn_shadow.setBlurRadius(20)
+            btn_shadow.setColor(SHADOW_GLOW)
+            btn_shadow.setOffset(0, 4)
+            self.validate_btn.setGraphicsEffect(btn_shadow)
         
         self.validate_btn.clicked.connect(self.start_validation)
         self.validate_btn.setEnabled(False)
@@ -486,9 +575,9 @@ class ResourcePackValidator(QMainWindow):
         
         # Status label
         self.status_label = QLabel("")
-        self.status_label.setFont(QFont("Segoe UI", 11))
+        self.status_label.setFont(FONT_BODY)
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.status_label.setStyleSheet("color: rgba(180, 160, 170, 0.7);")
+        self.status_label.setObjectName("statusLabel")
         self.status_label.setMinimumHeight(25)
         main_layout.addWidget(self.status_label)
         
@@ -499,23 +588,18 @@ class ResourcePackValidator(QMainWindow):
         console_layout.setContentsMargins(20, 16, 20, 16)
         
         console_title = QLabel("Validation Log")
-        console_title.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
-        console_title.setStyleSheet("color: rgba(255, 255, 255, 0.95);")
+        console_title.setFont(FONT_SECTION)
+        console_title.setObjectName("consoleTitle")
         console_layout.addWidget(console_title)
         
-        self.console = QTextEdit()
+        self.console = QPlainTextEdit()
         self.console.setReadOnly(True)
-        self.console.setFont(QFont("Consolas", 10))
-        self.console.setStyleSheet("""
-            QTextEdit {
-                background-color: rgba(0, 0, 0, 0.3);
-                color: rgba(230, 220, 225, 0.95);
-                border: 1px solid rgba(255, 255, 255, 0.08);
-                border-radius: 8px;
-                padding: 16px;
-                line-height: 1.4;
-            }
-        """)
+        # Append-only log - no undo stack and a capped line count to bound
+        # memory on long runs
+        self.console.setUndoRedoEnabled(False)
+        self.console.setMaximumBlockCount(5000)
+        self.console.setFont(FONT_MONO)
+        self.console.setObjectName("console")
         console_layout.addWidget(self.console)
         
         main_layout.addWidget(console_frame)
@@ -531,10 +615,10 @@ class ResourcePackValidator(QMainWindow):
         version_author_layout.setSpacing(2)
         
         version_label = QLabel("v1.0.0")
-        version_label.setStyleSheet("color: rgba(150, 140, 150, 0.5); font-size: 9pt;")
+        version_label.setObjectName("versionLabel")
         
         author_label = QLabel("Created By: SayMC")
-        author_label.setStyleSheet("color: rgba(150, 140, 150, 0.45); font-size: 8.5pt;")
+        author_label.setObjectName("authorLabel")
         
         version_author_layout.addWidget(version_label)
         version_author_layout.addWidget(author_label)
@@ -550,10 +634,17 @@ class ResourcePackValidator(QMainWindow):
         self.status_label.setText(f"✓ Ready to validate: {Path(file_path).name}")
         
     def log(self, message: str) -> None:
-        """Add message to console"""
-        self.console.append(message)
-        self.console.moveCursor(QTextCursor.MoveOperation.End)
-        QApplication.processEvents()
+        """Queue message for the console - written on the next timer tick"""
+        self._log_buffer.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+        
+    def flush_log(self) -> None:
+        """Write all buffered messages to the console in one append"""
+        self._log_timer.stop()
+        if self._log_buffer:
+            self.console.appendPlainText('\n'.join(self._log_buffer))
+            self._log_buffer.clear()
         
     def start_validation(self) -> None:
         """Start the validation process"""
@@ -562,19 +653,28 @@ class ResourcePackValidator(QMainWindow):
             return
         
         # Reset UI
+        self._log_timer.stop()
+        self._log_buffer.clear()
         self.console.clear()
         self.validate_btn.setEnabled(False)
         self.drop_zone.setEnabled(False)
         self.status_label.setText("🔍 Validating...")
         
-        # Start validation thread
+        # Start validation thread - queued connections deliver the worker's
+        # signals through the running GUI event loop, so the slots never
+        # need to pump events themselves
         self.validator_thread = ValidatorThread(self.input_file, self.validator_script)
-        self.validator_thread.log_update.connect(self.log)
-        self.validator_thread.finished_signal.connect(self.on_validation_finished)
+        self.validator_thread.log_update.connect(
+            self.log, Qt.ConnectionType.QueuedConnection
+        )
+        self.validator_thread.finished_signal.connect(
+            self.on_validation_finished, Qt.ConnectionType.QueuedConnection
+        )
         self.validator_thread.start()
         
     def on_validation_finished(self, success: bool, message: str) -> None:
         """Handle validation completion"""
+        self.flush_log()
         self.validate_btn.setEnabled(True)
         self.drop_zone.setEnabled(True)
         
@@ -591,9 +691,10 @@ def main() -> None:
     app.setStyle("Fusion")
     
     palette = QPalette()
-    palette.setColor(QPalette.ColorRole.Window, QColor(10, 10, 10))
-    palette.setColor(QPalette.ColorRole.WindowText, QColor(255, 255, 255))
+    palette.setColor(QPalette.ColorRole.Window, COLOR_WINDOW)
+    palette.setColor(QPalette.ColorRole.WindowText, COLOR_TEXT)
     app.setPalette(palette)
+    app.setStyleSheet(APP_QSS)
     
     window = ResourcePackValidator()
     window.show()